@@ -735,7 +735,7 @@ def reduce(data, op='sum', mpiroot=0, mpicomm=None):
 
 
 @CurrentMPIComm.enable
-def gather(data, mpiroot=0, mpicomm=None):
+def gather(data, mpiroot=0, mpicomm=None, counts=None):
     """
     Taken from https://github.com/bccp/nbodykit/blob/master/nbodykit/utils.py.
     Gather the input data array from all ranks to the specified ``mpiroot``.
@@ -754,6 +754,11 @@ def gather(data, mpiroot=0, mpicomm=None):
     mpicomm : MPI communicator, default=None
         The MPI communicator.
 
+    counts : array_like, default=None
+        Optionally, the length of ``data`` on each rank, if already exchanged,
+        e.g. when gathering several arrays of the same length;
+        in this case the collective shape / dtype checks are skipped.
+
     Returns
     -------
     recvbuffer : array_like, None
@@ -777,8 +782,15 @@ def gather(data, mpiroot=0, mpicomm=None):
     local_length = data.shape[0]
 
     # check dtypes and shapes
-    shapes = mpicomm.allgather(data.shape)
-    dtypes = mpicomm.allgather(data.dtype)
+    if counts is None:
+        shapes = mpicomm.allgather(data.shape)
+        dtypes = mpicomm.allgather(data.dtype)
+    else:
+        counts = np.asarray(counts, dtype='i8')
+        if counts.size != mpicomm.size:
+            raise ValueError('counts must have one entry per rank in gather')
+        shapes = [(int(count),) + shape[1:] for count in counts]
+        dtypes = [dtype]
 
     # check for structured data
     if dtypes[0].char == 'V':
@@ -792,42 +804,28 @@ def gather(data, mpiroot=0, mpicomm=None):
         if any(dtypes[0][name] == 'O' for name in dtypes[0].names):
             raise ValueError('object data types ("O") not allowed in structured data in gather')
 
-        # compute the new shape for each rank
-        newlength = mpicomm.allreduce(local_length)
-        newshape = list(data.shape)
-        newshape[0] = newlength
-
-        # the return array
-        if mpiroot is Ellipsis or mpicomm.rank == mpiroot:
-            recvbuffer = np.empty(newshape, dtype=dtypes[0], order='C')
-        else:
-            recvbuffer = None
-
-        for name in dtypes[0].names:
-            d = gather(data[name], mpiroot=mpiroot, mpicomm=mpicomm)
-            if mpiroot is Ellipsis or mpicomm.rank == mpiroot:
-                recvbuffer[name] = d
-
-        return recvbuffer
+        # a structured array is a contiguous block of bytes:
+        # gather it in the single Gatherv below instead of one collective per field
 
     # check for 'O' data types
     if dtypes[0] == 'O':
         raise ValueError('object data types ("O") not allowed in structured data in gather')
 
     # check for bad dtypes and bad shapes
-    if mpiroot is Ellipsis or mpicomm.rank == mpiroot:
-        bad_shape = any(s[1:] != shapes[0][1:] for s in shapes[1:])
-        bad_dtype = any(dt != dtypes[0] for dt in dtypes[1:])
-    else:
-        bad_shape, bad_dtype = None, None
+    if counts is None:
+        if mpiroot is Ellipsis or mpicomm.rank == mpiroot:
+            bad_shape = any(s[1:] != shapes[0][1:] for s in shapes[1:])
+            bad_dtype = any(dt != dtypes[0] for dt in dtypes[1:])
+        else:
+            bad_shape, bad_dtype = None, None
 
-    if mpiroot is not Ellipsis:
-        bad_shape, bad_dtype = mpicomm.bcast((bad_shape, bad_dtype), root=mpiroot)
+        if mpiroot is not Ellipsis:
+            bad_shape, bad_dtype = mpicomm.bcast((bad_shape, bad_dtype), root=mpiroot)
 
-    if bad_shape:
-        raise ValueError('mismatch between shape[1:] across ranks in gather')
-    if bad_dtype:
-        raise ValueError('mismatch between dtypes across ranks in gather')
+        if bad_shape:
+            raise ValueError('mismatch between shape[1:] across ranks in gather')
+        if bad_dtype:
+            raise ValueError('mismatch between dtypes across ranks in gather')
 
     shape = data.shape
     dtype = data.dtype
@@ -838,10 +836,13 @@ def gather(data, mpiroot=0, mpicomm=None):
     dt = MPI.BYTE.Create_contiguous(itemsize)
     dt.Commit()
 
-    # compute the new shape for each rank
-    newlength = mpicomm.allreduce(local_length)
+    # the recv counts
+    if counts is None:
+        counts = mpicomm.allgather(local_length)
+    counts = np.array(counts, order='C')
+
     newshape = list(shape)
-    newshape[0] = newlength
+    newshape[0] = int(counts.sum())
 
     # the return array
     if mpiroot is Ellipsis or mpicomm.rank == mpiroot:
@@ -849,10 +850,6 @@ def gather(data, mpiroot=0, mpicomm=None):
     else:
         recvbuffer = None
 
-    # the recv counts
-    counts = mpicomm.allgather(local_length)
-    counts = np.array(counts, order='C')
-
     # the recv offsets
     offsets = np.zeros_like(counts, order='C')
     offsets[1:] = counts.cumsum()[:-1]
@@ -860,6 +857,10 @@ def gather(data, mpiroot=0, mpicomm=None):
     # gather to mpiroot
     if mpiroot is Ellipsis:
         mpicomm.Allgatherv([data, dt], [recvbuffer, (counts, offsets), dt])
+    elif mpicomm.rank == mpiroot:
+        # Copy root's contribution straight into place and skip the self-send
+        recvbuffer[offsets[mpiroot]:offsets[mpiroot] + local_length] = data
+        mpicomm.Gatherv(MPI.IN_PLACE, [recvbuffer, (counts, offsets), dt], root=mpiroot)
     else:
         mpicomm.Gatherv([data, dt], [recvbuffer, (counts, offsets), dt], root=mpiroot)
 
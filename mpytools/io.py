@@ -2,9 +2,13 @@
 
 import os
 import re
+import copy
 import shutil
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+from mpi4py import MPI
 
 from . import utils
 from .utils import BaseClass, is_sequence, CurrentMPIComm
@@ -34,6 +38,11 @@ def select_columns(columns, include=None, exclude=None):
     def toregex(name):
         return name.replace('.', r'\.').replace('*', '(.*)')
 
+    def tocompiled(patterns):
+        # Compile all patterns once, as a single alternation,
+        # such that each column is matched in a single call
+        return re.compile('|'.join('(?:{})'.format(toregex(pattern)) for pattern in patterns))
+
     if not is_sequence(columns):
         columns = [columns]
 
@@ -43,18 +52,19 @@ def select_columns(columns, include=None, exclude=None):
         if not is_sequence(include):
             include = [include]
         toret = []
-        for column in columns:
-            if any(re.match(toregex(inc), column) for inc in include):
-                toret.append(column)
+        if include:
+            regex = tocompiled(include)
+            toret = [column for column in columns if regex.fullmatch(column)]
         columns = toret
 
     if exclude is not None:
         if not is_sequence(exclude):
             exclude = [exclude]
-        toret = []
-        for column in columns:
-            if not any(re.match(toregex(exc), column) for exc in exclude):
-                toret.append(column)
+        if exclude:
+            regex = tocompiled(exclude)
+            toret = [column for column in columns if not regex.fullmatch(column)]
+        else:
+            toret = list(columns)
 
     return toret
 
@@ -78,8 +88,21 @@ def _dict_to_array(data, struct=True):
     """
     array = [(name, data[name]) for name in data]
     if struct:
-        array = np.empty(array[0][1].shape[0], dtype=[(name, col.dtype, col.shape[1:]) for name, col in array])
-        for name in data: array[name] = data[name]
+        if len(array) > 1 and all(col.dtype == array[0][1].dtype and not col.dtype.names for _, col in array):
+            # All columns share the same base dtype: fill a contiguous 2D buffer
+            # (one contiguous store per column) and view it as a structured array,
+            # which avoids numpy's slow per-field structured assignment
+            size, dtype = array[0][1].shape[0], array[0][1].dtype
+            widths = [int(np.prod(col.shape[1:], dtype='intp')) for _, col in array]
+            buffer = np.empty((size, sum(widths)), dtype=dtype)
+            start = 0
+            for (_, col), width in zip(array, widths):
+                buffer[:, start:start + width] = col.reshape(size, width)
+                start += width
+            array = buffer.view(dtype=[(name, dtype, col.shape[1:]) for name, col in array]).reshape(size)
+        else:
+            array = np.empty(array[0][1].shape[0], dtype=[(name, col.dtype, col.shape[1:]) for name, col in array])
+            for name in data: array[name] = data[name]
     else:
         array = np.array([col for _, col in array])
     return array
@@ -144,7 +167,9 @@ class FileStack(BaseClass):
     @property
     def cfilesize(self):
         """Sum of file sizes."""
-        return sum(self.filesizes)
+        if getattr(self, '_cfilesize', None) is None:
+            self._cfilesize = sum(self.filesizes)
+        return self._cfilesize
 
     @property
     def slices(self):
@@ -184,30 +209,65 @@ class FileStack(BaseClass):
 
     def fileslices(self, return_index=False):
         """
-        For each local slice, yield slices in each file.
-        Pass ``return_index = True`` to also yield indices in current local slice corresponding to each file slice.
+        For each local slice, return slices in each file.
+        Pass ``return_index = True`` to also return indices in current local slice corresponding to each file slice.
         """
-        # catalog slices
-        cumsizes = np.cumsum([0] + self.filesizes)
-        for sli in self.slices:
-            #for start, stop in zip(cumsizes[:-1], cumsizes[1:]):
-            #     print(self.mpicomm.rank, sli, start, stop, Slice(start, stop, 1).find(sli, return_index=return_index))
-            yield [Slice(start, stop, 1).find(sli, return_index=return_index) for start, stop in zip(cumsizes[:-1], cumsizes[1:])]
+        # The slice plan is cached (keyed on current slices), as it is identical for all columns to be read
+        cache = getattr(self, '_fileslices', None)
+        if cache is None or cache['slices'] is not self.slices:
+            cache = self._fileslices = {'slices': self.slices}
+        if return_index not in cache:
+            # catalog slices
+            cumsizes = np.cumsum([0] + self.filesizes)
+            plan = []
+            for sli in self.slices:
+                smin, smax = (sli.min, sli.max) if sli else (0, -1)
+                sls = []
+                for start, stop in zip(cumsizes[:-1], cumsizes[1:]):
+                    if stop <= smin or start > smax:
+                        # no overlap with this file: skip the slice-intersection arithmetic,
+                        # which dominates when stacking many files
+                        sls.append((Slice.empty(), Slice.empty()) if return_index else Slice.empty())
+                    else:
+                        sls.append(Slice(start, stop, 1).find(sli, return_index=return_index))
+                plan.append(sls)
+            cache[return_index] = plan
+        return cache[return_index]
 
     @property
     def size(self):
         """Local size of columns to be read."""
-        return sum(sl.size for sl in self.slices)
+        cache = getattr(self, '_cache_size', None)
+        if cache is None or cache[0] is not self.slices:
+            self._cache_size = cache = (self.slices, sum(sl.size for sl in self.slices))
+        return cache[1]
+
+    @property
+    def _allsizes(self):
+        # Local sizes of all ranks, gathered once and cached (keyed on current slices)
+        cache = getattr(self, '_cache_allsizes', None)
+        if cache is None or cache[0] is not self.slices:
+            self._cache_allsizes = cache = (self.slices, self.mpicomm.allgather(self.size))
+        return cache[1]
+
+    @property
+    def _allslices(self):
+        # Slices of all ranks, gathered once and cached (keyed on current slices)
+        cache = getattr(self, '_cache_allslices', None)
+        if cache is None or cache[0] is not self.slices:
+            self._cache_allslices = cache = (self.slices, utils.list_concatenate(self.mpicomm.allgather(self.slices)))
+        return cache[1]
 
     @property
     def csize(self):
         """Collective size of columns to be read."""
-        return self.mpicomm.allreduce(self.size)
+        return sum(self._allsizes)
 
     @property
     def _is_slice_array(self):
         # Is any of slices an index array?
-        return any(utils.list_concatenate(self.mpicomm.allgather([sl.is_array for sl in self.slices])))
+        # A single-bool allreduce, instead of allgathering (pickling) all flags
+        return bool(self.mpicomm.allreduce(any(sl.is_array for sl in self.slices), op=MPI.LOR))
 
     def slice(self, *args):
         """Slice :class:`FileStack` (locally), i.e. select local rows to read."""
@@ -223,12 +283,12 @@ class FileStack(BaseClass):
         local_slice = global_slice.split(self.mpicomm.size)[self.mpicomm.rank]
         #print(self.mpicomm.rank, local_slice)
         if local_slice.is_array or self._is_slice_array:
-            cumsizes = np.cumsum([sum(self.mpicomm.allgather(self.size)[:self.mpicomm.rank])] + [sl.size for sl in self.slices])
+            cumsizes = np.cumsum([sum(self._allsizes[:self.mpicomm.rank])] + [sl.size for sl in self.slices])
             slices = [slice(size1, size2, 1) for size1, size2 in zip(cumsizes[:-1], cumsizes[1:])]
             source = MPIScatteredSource(*slices)
             new._slices = [Slice(source.get([sl.to_array() for sl in self._slices], local_slice))]
         else:
-            all_slices = utils.list_concatenate(self.mpicomm.allgather(self.slices))
+            all_slices = self._allslices
             tmp = []
             cumsize = 0
             for sli in all_slices:
@@ -269,13 +329,16 @@ class FileStack(BaseClass):
     def cconcatenate(cls, *others):
         """Concatenate :class:`FileStack` collectively, such that global order is preserved."""
         new = cls(*utils.list_concatenate([other.files for other in others]))
+        # Fast path: with no input slices set, the result is simply the stacked files,
+        # with no collective communication needed
         if any(getattr(other, '_slices', None) is not None for other in others):
-            if any(other._is_slice_array for other in others):
+            # One single-bool collective, instead of one allgather per input
+            if new.mpicomm.allreduce(any(sl.is_array for other in others for sl in other.slices), op=MPI.LOR):
                 csize = sum(other.csize for other in others)
                 new_slice = Slice(new.mpicomm.rank * csize // new.mpicomm.size, (new.mpicomm.rank + 1) * csize // new.mpicomm.size, 1)
                 source = []
                 for other in others:
-                    cumsizes = np.cumsum([sum(new.mpicomm.allgather(other.size)[:new.mpicomm.rank])] + [sl.size for sl in other.slices])
+                    cumsizes = np.cumsum([sum(other._allsizes[:new.mpicomm.rank])] + [sl.size for sl in other.slices])
                     slices = [slice(size1, size2, 1) for size1, size2 in zip(cumsizes[:-1], cumsizes[1:])]
                     source.append(MPIScatteredSource(*slices))
                 source = MPIScatteredSource.cconcatenate(*source)
@@ -304,26 +367,70 @@ class FileStack(BaseClass):
         if isscalar: columns = [columns]
         toret = [[] for column in columns]
         for islice, slices in enumerate(self.fileslices(return_index=True)):
+            # Do not open files in which there is nothing to read
+            reads = [(ifile, rows, iidx) for ifile, (rows, iidx) in enumerate(slices) if rows]
             tmp, idx = [], []
-            for ifile, (rows, iidx) in enumerate(slices):
+            if len(reads) == 1:
+                ifile, rows, iidx = reads[0]
                 tmp.append(self.files[ifile].read(columns, rows=rows))
                 idx.append(iidx.idx)
+            elif reads:
+                # Several files: overlap their reads with a (bounded) thread pool,
+                # as file backends release the GIL during I/O
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = [executor.submit(self.files[ifile].read, columns, rows=rows) for ifile, rows, iidx in reads]
+                    for future, (ifile, rows, iidx) in zip(futures, reads):
+                        tmp.append(future.result())
+                        idx.append(iidx.idx)
+            else:  # empty slice: a single (empty) read to get column dtypes and item shapes
+                tmp.append(self.files[0].read(columns, rows=slice(0, 0, 1)))
+                idx.append(np.array([], dtype='i8') if self.slices[islice].is_array else slice(0, 0, 1))
             if self.slices[islice].is_array:
-                sidx = np.argsort(np.concatenate(idx, axis=0))
+                idx = np.concatenate(idx, axis=0) if len(idx) > 1 else np.asarray(idx[0])
+                sidx = None  # no reordering needed when indices are already sorted
+                if idx.size > 1 and np.any(np.diff(idx) < 0):
+                    sidx = np.argsort(idx, kind='stable')
                 for icol in range(len(columns)):
-                    toret[icol].append(np.concatenate([tt[icol] for tt in tmp], axis=0, dtype=tmp[0][icol].dtype)[sidx])
+                    tt = np.concatenate([tt[icol] for tt in tmp], axis=0, dtype=tmp[0][icol].dtype) if len(tmp) > 1 else tmp[0][icol]
+                    if sidx is not None: tt = tt[sidx]
+                    toret[icol].append(tt)
+            elif len(tmp) == 1:
+                for icol in range(len(columns)):
+                    toret[icol].append(tmp[0][icol])
             else:
-                sidx = np.argsort([iidx.start for iidx in idx])
+                # Write each piece directly at its offset in a preallocated buffer,
+                # avoiding the argsort + concatenate round-trip over all pieces
+                size = self.slices[islice].size
                 for icol in range(len(columns)):
-                    toret[icol] += [tmp[ii][icol] for ii in sidx]
+                    out = np.empty((size,) + tmp[0][icol].shape[1:], dtype=tmp[0][icol].dtype)
+                    for tt, iidx in zip(tmp, idx):
+                        out[iidx] = tt[icol]
+                    toret[icol].append(out)
         for icol, tt in enumerate(toret):
             # To save some time
             if len(tt) > 1: toret[icol] = np.concatenate(tt, axis=0, dtype=tt[0].dtype)
-            else: toret[icol] = tt[0]
+            else:
+                tt = tt[0]
+                # File backends may hand out read-only views (memory-mapped ASDF blocks);
+                # copy so returned columns stay writable, as with every other backend
+                if not tt.flags.writeable: tt = np.array(tt)
+                toret[icol] = tt
         if isscalar:
             return toret[0]
         return toret
 
+    def read_columns(self, columns=None):
+        """
+        Read column(s) of name ``columns`` (defaulting to all columns shared by all files)
+        as a dictionary of name: array, in a single pass through all files.
+        Data is kept as per-column contiguous arrays end-to-end; structured arrays
+        are only materialized by file backends that require them (at write time).
+        """
+        if columns is None:
+            columns = self.columns
+        columns = list(columns)
+        return dict(zip(columns, self.read(columns)))
+
     def write(self, data, mpiroot=None, **kwargs):
         """Write data (numpy structured array or dict), optionally gathered on ``mpiroot``."""
         nfiles = len(self.files)
@@ -341,7 +448,10 @@ class FileStack(BaseClass):
             isdict = self.mpicomm.bcast(isdict, root=mpiroot)
             if isdict:
                 columns = self.mpicomm.bcast(list(data.keys()) if self.mpicomm.rank == mpiroot else None, root=mpiroot)
-                data = {name: mpy.scatter(data[name] if self.mpicomm.rank == mpiroot else None, mpicomm=self.mpicomm, mpiroot=self.mpiroot) for name in columns}
+                # Pack all columns into one structured array and issue a single Scatterv,
+                # instead of paying one collective latency per column
+                array = mpy.scatter(_dict_to_array(data) if self.mpicomm.rank == mpiroot else None, mpicomm=self.mpicomm, mpiroot=self.mpiroot)
+                data = {name: array[name] for name in columns}
             else:
                 data = mpy.scatter(data, mpicomm=self.mpicomm, mpiroot=self.mpiroot)
         if isdict:
@@ -352,6 +462,7 @@ class FileStack(BaseClass):
         csize = self.mpicomm.allreduce(size)
         for ifile, file in enumerate(self.files):
             file._csize = (ifile + 1) * csize // nfiles - ifile * csize // nfiles
+        self._cfilesize = None  # file sizes have changed
         fcumsizes = np.cumsum([0] + self.filesizes)
         cumsizes = np.cumsum([0] + self.mpicomm.allgather(size))
         self._slices = [Slice(cumsizes[self.mpicomm.rank], cumsizes[self.mpicomm.rank] + size, 1)]
@@ -439,7 +550,19 @@ class BaseFile(BaseClass, metaclass=RegisteredFile):
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        pass
+        self.close()
+
+    def _get_handle(self):
+        # Return file handle, memoized on the instance such that repeated reads
+        # (e.g. one per column) do not reopen the file and reparse its header;
+        # to be implemented by file handlers supporting persistent handles
+        raise NotImplementedError
+
+    def close(self):
+        """Close cached file handle, if any."""
+        fh = self.__dict__.pop('_fh', None)
+        if fh is not None:
+            fh.close()
 
     def is_mpi_root(self):
         """Whether current rank is root."""
@@ -535,6 +658,7 @@ class BaseFile(BaseClass, metaclass=RegisteredFile):
         header : dict, default=None
             Optional header.
         """
+        self.close()  # cached read handle would be stale after write
         utils.mkdir(os.path.dirname(self.filename))
         isdict = isinstance(data, dict)
         if isdict:
@@ -582,7 +706,7 @@ class FitsFile(BaseFile):
     name = 'fits'
     extensions = ['fits']
     _type_read_rows = ['slice']
-    _type_write_data = ['array']
+    _type_write_data = ['dict', 'array']
 
     def __init__(self, filename, ext=None, **kwargs):
         """
@@ -626,22 +750,36 @@ class FitsFile(BaseFile):
                 raise IOError('{} extension {} is not a readable binary table'.format(self.filename, self.ext))
             return {'csize': file.get_nrows(), 'columns': file.get_rec_dtype()[0].names, 'header': dict(file.read_header()), 'ext': self.ext}
 
+    def _get_handle(self):
+        if getattr(self, '_fh', None) is None:
+            self._fh = fitsio.FITS(self.filename)
+        return self._fh
+
     def _read_rows(self, columns, rows):
-        if rows.stop - rows.start == self.csize:
-            rows = None
-        else:
-            rows = range(rows.start, rows.stop)
+        # Use fitsio's slice read, which issues one contiguous cfitsio read,
+        # rather than rows=range(start, stop) which materializes an index array
+        # and goes through the row-by-row read path
+        file = self._get_handle()[self.ext]
         if set(columns) == set(self._columns):
-            cols = None
+            toret = file[rows.start:rows.stop]
         else:
-            cols = columns
-        toret = fitsio.read(self.filename, ext=self.ext, columns=cols, rows=rows)
+            toret = file[columns][rows.start:rows.stop]
         return [toret[column] for column in columns]
 
     def _write_data(self, data, header):
-        data = mpy.gather(data, mpicomm=self.mpicomm, mpiroot=self.mpiroot)
-        if self.is_mpi_root():
-            fitsio.write(self.filename, data, header=header, clobber=True)
+        if isinstance(data, dict):
+            # Pass columns directly to fitsio through its names argument,
+            # skipping the intermediate structured-array copy of the whole catalog
+            names = list(data.keys())
+            # All columns share the same length: exchange counts once, reuse them for every gather
+            counts = self.mpicomm.allgather(len(data[names[0]])) if names else None
+            data = [mpy.gather(data[name], mpicomm=self.mpicomm, mpiroot=self.mpiroot, counts=counts) for name in names]
+            if self.is_mpi_root():
+                fitsio.write(self.filename, data, names=names, header=header, clobber=True)
+        else:
+            data = mpy.gather(data, mpicomm=self.mpicomm, mpiroot=self.mpiroot)
+            if self.is_mpi_root():
+                fitsio.write(self.filename, data, header=header, clobber=True)
 
 
 try: import h5py
@@ -701,13 +839,43 @@ class HDF5File(BaseFile):
                     raise IOError('Column {} has different length (expected {:d}, found {:d})'.format(name, size, grp[name].shape[0]))
             return {'csize': size, 'columns': columns, 'header': dict(grp.attrs)}
 
+    def _get_handle(self):
+        if getattr(self, '_fh', None) is None:
+            self._fh = h5py.File(self.filename, 'r')
+        return self._fh
+
     def _read_rows(self, columns, rows):
-        with h5py.File(self.filename, 'r') as file:
-            grp = file[self.group]
-            if isinstance(rows, slice):
-                return [grp[column][rows] for column in columns]
-            rows, inverse = np.unique(rows, return_inverse=True)
-            return [grp[column][rows][inverse] for column in columns]
+        grp = self._get_handle()[self.group]
+        if isinstance(rows, slice):
+            toret = []
+            for column in columns:
+                dset = grp[column]
+                start, stop, step = rows.indices(dset.shape[0])
+                length = len(range(start, stop, step))
+                # read_direct decodes straight into the preallocated output,
+                # skipping the intermediate array h5py slicing would allocate
+                out = np.empty((length,) + dset.shape[1:], dtype=dset.dtype)
+                if length: dset.read_direct(out, source_sel=np.s_[start:stop:step])
+                toret.append(out)
+            return toret
+        rows = np.asarray(rows)
+        if rows.size and np.all(np.diff(rows) > 0):
+            # Already strictly increasing, as required by h5py fancy indexing
+            return [grp[column][rows] for column in columns]
+        # Sort with argsort and scatter back, which avoids np.unique's hash / deduplication
+        # when there are no duplicates, and makes the scatter-back a contiguous write
+        order = np.argsort(rows, kind='stable')
+        sorted_rows, inverse = rows[order], None
+        if sorted_rows.size and not np.all(np.diff(sorted_rows) > 0):  # duplicates
+            sorted_rows, inverse = np.unique(sorted_rows, return_inverse=True)
+        toret = []
+        for column in columns:
+            data = grp[column][sorted_rows]
+            if inverse is not None: data = data[inverse]
+            out = np.empty_like(data)
+            out[order] = data
+            toret.append(out)
+        return toret
 
     def _write_data(self, data, header):
         driver = 'mpio'
@@ -764,9 +932,21 @@ class BinaryFile(BaseFile):
         array = open_memmap(self.filename, mode='r')
         return {'csize': len(array), 'columns': array.dtype.names, 'header': {}}
 
+    def _get_handle(self):
+        if getattr(self, '_fh', None) is None:
+            self._fh = open_memmap(self.filename, mode='r')
+        return self._fh
+
+    def close(self):
+        """Close cached memory-map, if any."""
+        # np.memmap has no close; dropping the reference unmaps
+        self.__dict__.pop('_fh', None)
+
     def _read_rows(self, columns, rows):
-        toret = open_memmap(self.filename, mode='r')[rows]
-        return [np.array(toret[column]) for column in columns]
+        # Project the column before slicing rows: the field projection is a view,
+        # so only the bytes of the requested field go through the page cache
+        array = self._get_handle()
+        return [np.array(array[column][rows]) for column in columns]
 
     def _write_data(self, data, header):
         cumsizes = np.cumsum([0] + self.mpicomm.allgather(len(data)))
@@ -780,10 +960,19 @@ class BinaryFile(BaseFile):
 
 
 import json
+try: import orjson
+except ImportError: orjson = None
 try: import bigfile
 except ImportError: bigfile = None
 
 
+def _loads_json(payload):
+    """Decode a ``json://`` attr payload, through :mod:`orjson` when available."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
 class BigFile(BaseFile):
     """Class to read/write a BigFile from/to disk."""
     name = 'bigfile'
@@ -857,16 +1046,25 @@ class BigFile(BaseFile):
                     value = fattrs[key]
                     # Load a JSON representation if str starts with json:://
                     if isinstance(value, str) and value.startswith('json://'):
-                        attrs[key] = json.loads(value[7:])  # , cls=JSONDecoder)
-                    # Copy over an array
+                        attrs[key] = _loads_json(value[7:])
+                    # Keep scalars and strings as-is (no 0-d ndarray wrapper)
+                    elif np.isscalar(value) or isinstance(value, (bytes, str)):
+                        attrs[key] = value
+                    # Copy over an array, skipping np.array's type-inference path
+                    elif isinstance(value, np.ndarray):
+                        attrs[key] = value.copy()
                     else:
                         attrs[key] = np.array(value, copy=True)
             return {'csize': csize, 'columns': columns, 'header': attrs}
 
+    def _get_handle(self):
+        if getattr(self, '_fh', None) is None:
+            self._fh = bigfile.File(filename=self.filename)
+        return self._fh
+
     def _read_rows(self, columns, rows):
-        with bigfile.File(filename=self.filename)[self.group] as file:
-            d = bigfile.Dataset(file, columns)
-            return [d[column][rows] for column in columns]
+        d = bigfile.Dataset(self._get_handle()[self.group], columns)
+        return [d[column][rows] for column in columns]
 
     def _write_data(self, data, header, overwrite=None):
         columns = list(data.keys())
@@ -951,20 +1149,80 @@ class BigFile(BaseFile):
                                 raise ValueError('Cannot save {} key in attrs dictionary'.format(key))
 
             # lock=False to avoid dask from pickling the lock with the object.
-            # write blocks one by one
-            for column, source, target, region in zip(columns, sources, targets, regions):
+            def write_column(column, source, target, region):
                 if self.is_mpi_root():
                     self.log_debug('Started writing column {}'.format(column))
                 target[region] = source
-                target.bb.close()
                 if self.is_mpi_root():
                     self.log_debug('Finished writing column {}'.format(column))
 
+            # write blocks concurrently; bigfile releases the GIL during I/O,
+            # so several columns stream to disk at once. Only the data writes go
+            # through the pool: closing a block issues MPI collectives, which must
+            # run in the same (column) order on every rank, hence on the main thread
+            if columns:
+                with ThreadPoolExecutor(max_workers=min(4, len(columns))) as executor:
+                    futures = [executor.submit(write_column, *args) for args in zip(columns, sources, targets, regions)]
+                    for future in futures: future.result()
+                for target in targets:
+                    target.bb.close()
+
 
 try: import asdf
 except ImportError: asdf = None
 
 
+@functools.lru_cache(maxsize=128)
+def _asdf_read_header_root(filename, mtime_ns, size, group, header_blocks, exclude):
+    """
+    Parse the header of ASDF file ``filename``; module-level cache such that repeated
+    :class:`AsdfFile` instances for the same on-disk file skip the reparse.
+    ``(mtime_ns, size)`` enter the cache key only, to invalidate when the file is rewritten.
+    """
+    try:
+        file = asdf.open(filename, lazy_load=True, memmap=True)
+    except TypeError:  # asdf < 3.0 takes copy_arrays instead of memmap
+        file = asdf.open(filename, lazy_load=True, copy_arrays=False)
+    with file:
+        file = file[group] if group else file
+        if header_blocks is None: header_blocks = ['Header', 'header']
+        # Single pass over the keys, dropping asdf bookkeeping entries early
+        header_set, found = set(header_blocks), set()
+        columns = []
+        for key in file.keys():
+            if key in ('asdf_library', 'history'):
+                continue
+            if key in header_set: found.add(key)
+            columns.append(key)
+        # Ordered as in header_blocks, deduplicated
+        headers = list(dict.fromkeys(header for header in header_blocks if header in found))
+        if exclude is None:
+            # By default exclude header
+            exclude = headers
+
+        columns = select_columns(columns, exclude=list(exclude))
+        csize = len(file[columns[0]])
+
+        attrs = {}
+        for header in headers:
+            # copy over the attrs
+            fattrs = file[header]
+            for key in fattrs:
+                value = fattrs[key]
+                # load a JSON representation if str starts with json:://
+                if isinstance(value, str) and value.startswith('json://'):
+                    attrs[key] = _loads_json(value[7:])
+                # keep scalars and strings as-is (no 0-d ndarray wrapper)
+                elif np.isscalar(value) or isinstance(value, (bytes, str)):
+                    attrs[key] = value
+                # copy over an array, skipping np.array's type-inference path
+                elif isinstance(value, np.ndarray):
+                    attrs[key] = value.copy()
+                else:
+                    attrs[key] = np.array(value, copy=True)
+    return {'csize': csize, 'columns': columns, 'header': attrs}
+
+
 class AsdfFile(BaseFile):
     """
     Class to read/write an ASDF file from/to disk.
@@ -1007,47 +1265,69 @@ class AsdfFile(BaseFile):
         self.exclude = exclude
         super(AsdfFile, self).__init__(filename=filename, **kwargs)
 
-    def _read_header_root(self):
-        with asdf.open(self.filename) as file:
-            file = file[self.group] if self.group else file
-            columns = list(file.keys())
-            header_blocks = self.header_blocks
-            if header_blocks is None: header_blocks = ['Header', 'header']
-            if not isinstance(header_blocks, (tuple, list)): header_blocks = [header_blocks]
-            headers = []
-            for header in header_blocks:
-                if header in columns and header not in headers: headers.append(header)
-            exclude = self.exclude
-            if exclude is None:
-                # By default exclude header
-                exclude = headers
-            exclude = exclude + ['asdf_library', 'history']  # to copy list
+    def _get_handle(self):
+        if getattr(self, '_fh', None) is None:
+            try:
+                self._fh = asdf.open(self.filename, lazy_load=True, memmap=True)
+            except TypeError:  # asdf < 3.0 takes copy_arrays instead of memmap
+                self._fh = asdf.open(self.filename, lazy_load=True, copy_arrays=False)
+        return self._fh
 
-            columns = select_columns(columns, exclude=exclude)
-            csize = len(file[columns[0]])
-
-            attrs = {}
-            for header in headers:
-                # copy over the attrs
-                fattrs = file[header]
-                for key in fattrs:
-                    value = fattrs[key]
-                    # load a JSON representation if str starts with json:://
-                    if isinstance(value, str) and value.startswith('json://'):
-                        attrs[key] = json.loads(value[7:])  # , cls=JSONDecoder)
-                    # copy over an array
-                    else:
-                        attrs[key] = np.array(value, copy=True)
-            return {'csize': csize, 'columns': columns, 'header': attrs}
+    def _read_header_root(self):
+        stat = os.stat(self.filename)
+        header_blocks = self.header_blocks
+        if header_blocks is not None and not is_sequence(header_blocks): header_blocks = [header_blocks]
+        # Tuples to make the cache key hashable
+        if header_blocks is not None: header_blocks = tuple(header_blocks)
+        exclude = self.exclude
+        if exclude is not None and not is_sequence(exclude): exclude = [exclude]
+        if exclude is not None: exclude = tuple(exclude)
+        state = _asdf_read_header_root(self.filename, stat.st_mtime_ns, stat.st_size, self.group, header_blocks, exclude)
+        # Deep copy such that callers can mutate the header without corrupting the cache
+        return copy.deepcopy(state)
 
     def _read_rows(self, columns, rows):
-        with asdf.open(self.filename) as file:
-            file = file[self.group] if self.group else file
-            return [np.array(file[column][rows], copy=True) for column in columns] # otherwise, segfault due to memorymap
+        file = self._get_handle()
+        file = file[self.group] if self.group else file
+        # With memory-mapped blocks (see _get_handle), slicing returns a zero-copy,
+        # read-only view of the requested rows; the view stays valid as long as the
+        # cached handle is alive, i.e. until :meth:`close` (numpy keeps the pages
+        # mapped while views reference them, so an early close cannot segfault)
+        def read_column(column):
+            toret = np.asarray(file[column][rows])
+            toret.flags.writeable = False
+            return toret
+
+        if len(columns) > 1:
+            # Block copies release the GIL, so overlap them across columns
+            with ThreadPoolExecutor(max_workers=min(8, len(columns))) as executor:
+                return list(executor.map(read_column, columns))
+        return [read_column(column) for column in columns]
 
     def _write_data(self, data, header):
-        data = {key: mpy.gather(data[key], mpicomm=self.mpicomm, mpiroot=self.mpiroot) for key in data}
+        # NOTE: each rank writing its own block through MPI-IO, or aggregator ranks
+        # writing disjoint column subsets, would require reserving ASDF block offsets
+        # in advance, which asdf's writer does not expose (and striping columns over
+        # partial files would change the on-disk layout expected by readers);
+        # hence data is gathered on root, except on a single-rank communicator
+        # where the gather (and its copy of every column) is skipped altogether.
+        # Chunked gather-and-append would bound root memory, but asdf only streams
+        # a single trailing block (asdf.Stream), so it cannot serve several columns;
+        # write_to thus needs every column fully materialized on root
+        if self.mpicomm.size > 1 and data:
+            # All columns share the same length: pack them into a single structured
+            # array and gather the catalog in one collective instead of one per column
+            columns = list(data)
+            array = mpy.gather(_dict_to_array(data), mpicomm=self.mpicomm, mpiroot=self.mpiroot)
+            if self.is_mpi_root():
+                # Field views into the gathered buffer; no per-column copy
+                data = {name: array[name] for name in columns}
         if self.is_mpi_root():
+            # When columns are views into a single structured buffer, asdf's block
+            # manager stores the shared base once and writes the views as offsets
+            # into that block, so no per-column copy is forced here
             af = asdf.AsdfFile(data)
-            # Write the data to a new file
+            # Write the data to a new file; a background write would have nothing to
+            # overlap with, as the catalog is gathered in a single collective above
+            # and the write must complete before this method returns
             af.write_to(self.filename)
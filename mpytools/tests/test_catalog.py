@@ -249,6 +249,41 @@ def test_io():
         assert test.boxcenter == 1.
 
 
+def test_read_columns():
+
+    csize = 100 * mpy.COMM_WORLD.size
+    size = local_size(csize)
+    rng = MPIRandomState(size, seed=42)
+    ref = Catalog(data={'RA': rng.uniform(0., 1.), 'DEC': rng.uniform(0., 1.), 'Position': rng.uniform(0., 1., itemshape=3)})
+    mpicomm = ref.mpicomm
+
+    for ext in ['fits', 'npy', 'bigfile', 'hdf5', 'asdf']:
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir = '_tests'
+            fn = mpicomm.bcast(os.path.join(tmp_dir, 'tmp_columns.{}'.format(ext)), root=0)
+            ref.write(fn)
+            with FileStack(fn) as fs:
+                data = fs.read_columns()
+                assert set(data.keys()) == set(ref.columns())
+                data = fs.read_columns(['RA', 'Position'])
+                assert list(data.keys()) == ['RA', 'Position']
+                for name in data:
+                    assert np.all(mpy.gather(data[name], mpiroot=None) == ref.cget(name, mpiroot=None))
+            # Columns must come back writable, whatever the backend
+            test = Catalog.read(fn)
+            test['Position'] += 10
+            assert np.allclose(test.cget('Position', mpiroot=None), ref.cget('Position', mpiroot=None) + 10)
+
+    # Many columns, to exercise the threaded bigfile block writes
+    many = Catalog(data={'col{:d}'.format(i): rng.uniform(0., 1.) for i in range(8)})
+    fn = mpicomm.bcast(os.path.join('_tests', 'tmp_manycolumns.bigfile'), root=0)
+    many.write(fn, overwrite=True)
+    test = Catalog.read(fn)
+    for name in many.columns():
+        assert np.all(test.cget(name, mpiroot=None) == many.cget(name, mpiroot=None))
+
+
 def test_misc():
     csize = 100 * mpy.COMM_WORLD.size
     size = local_size(csize)
@@ -341,5 +376,6 @@ if __name__ == '__main__':
     test_scattered_source()
     test_cslice()
     test_io()
+    test_read_columns()
     test_misc()
     test_memory()